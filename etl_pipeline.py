@@ -1,15 +1,81 @@
 # ETL Pipeline for Electricity Sales Data
-import pandas as pd
-import json
-from pandas import json_normalize
+from __future__ import annotations
+
+import functools
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+# pandas, numpy, pyarrow and orjson are imported inside the functions that use them, so
+# importing this module stays cheap until data is actually extracted or loaded
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+_LAZY_MODULES = {
+    'np': 'numpy',
+    'orjson': 'orjson',
+    'pd': 'pandas',
+    'pa': 'pyarrow',
+    'pc': 'pyarrow.compute',
+    'pq': 'pyarrow.parquet',
+}
+
+def __getattr__(name: str):
+    """
+    Resolve the lazily imported module aliases (e.g. `etl_pipeline.pd`) on first access.
+    """
+    if name in _LAZY_MODULES:
+        import importlib
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Fixed schema of the electricity sales data, built once at import rather than on every transform call
+_SALES_REQUIRED_COLUMNS = ('period', 'stateid', 'sectorName', 'price', 'price-units')
+_SALES_REQUIRED_COLUMN_SET = frozenset(_SALES_REQUIRED_COLUMNS)
+_SALES_COLUMN_MAPPING = {
+    'Period': 'period',
+    'Date': 'period',  # Possible variation from incorrect CSV
+    'StateID': 'stateid',
+    'StateId': 'stateid',
+    'SectorName': 'sectorName',
+    'sectorname': 'sectorName',
+    'Price': 'price',
+    'UnitPrice': 'price',  # Possible variation
+    'Price-Units': 'price-units',
+    'price_units': 'price-units',
+    'unit_price': 'price-units'  # Possible variation
+}
+_SALES_INPUT_COLUMNS = _SALES_REQUIRED_COLUMN_SET.union(_SALES_COLUMN_MAPPING)
+
+def sales_output_schema() -> pa.Schema:
+    """
+    Arrow schema of the transformed sales data, for writing every streamed chunk with the same types
+    (e.g., `load_chunked(chunks, 'loaded__electricity_sales.parquet', sales_output_schema())`).
+    
+    Returns:
+    pyarrow.Schema: Schema with the columns `year`, `month`, `stateid`, `price`, and `price-units`.
+    """
+    import pyarrow as pa
+    
+    return pa.schema([
+        ('year', pa.string()),
+        ('month', pa.string()),
+        ('stateid', pa.string()),
+        ('price', pa.float64()),
+        ('price-units', pa.string()),
+    ])
 
 def extract_tabular_data(file_path: str) -> pd.DataFrame:
     """
     Extract data from a tabular file format, with pandas.
     
     Parameters:
-    file_path (str): Path to the input file.
+    file_path (str): Path to the input file (e.g., 'electricity_sales.csv').
     
     Returns:
     pandas.DataFrame: Data extracted from the file.
@@ -17,22 +83,107 @@ def extract_tabular_data(file_path: str) -> pd.DataFrame:
     Raises:
     Exception: If the file extension is not .csv or .parquet.
     TypeError: If file_path is not a string.
+    FileNotFoundError: If the file is not found in the working directory.
     """
-    if not isinstance(file_path, str):
-        raise TypeError("file_path must be a string")
+    import pandas as pd
+    
+    if __debug__:
+        if not isinstance(file_path, str):
+            raise TypeError("file_path must be a string")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}. Ensure it is in the working directory (e.g., 'C:\\Users\\ayomi\\Documents\\Powering Data for the Department of Energy - Building an ETL Pipeline\\').")
     if file_path.endswith('.csv'):
-        return pd.read_csv(file_path)
+        return pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
     elif file_path.endswith('.parquet'):
-        return pd.read_parquet(file_path)
+        return pd.read_parquet(file_path, engine="pyarrow", dtype_backend="pyarrow")
     else:
         raise Exception("Warning: Invalid file extension. Please try with .csv or .parquet!")
 
+@functools.lru_cache(maxsize=8)
+def _read_parquet_metadata(file_path: str, mtime_ns: int, size: int) -> pq.FileMetaData:
+    """
+    Read the footer metadata of a Parquet file, cached so repeated chunked
+    reads of the same file only parse it once.
+    
+    Parameters:
+    file_path (str): Canonical (real) path to the Parquet file, so relative paths from different working directories do not collide.
+    mtime_ns (int): Modification time of the file in nanoseconds, so a rewritten file is read again.
+    size (int): Size of the file in bytes, to catch rewrites within the mtime granularity.
+    
+    Returns:
+    pyarrow.parquet.FileMetaData: Parsed file metadata.
+    """
+    import pyarrow.parquet as pq
+    
+    return pq.read_metadata(file_path)
+
+def extract_tabular_data_chunked(file_path: str, chunksize: int = 100_000, dtype: Optional[dict] = None) -> Iterator[pd.DataFrame]:
+    """
+    Extract data from a tabular file format in chunks, so the whole file is never held in memory.
+    
+    Parameters:
+    file_path (str): Path to the input file (e.g., 'electricity_sales.csv').
+    chunksize (int): Maximum number of rows per chunk.
+    dtype (dict, optional): Column dtypes to apply to each chunk (e.g., {'sectorName': 'category'}).
+    
+    Returns:
+    Iterator[pandas.DataFrame]: Chunks of the data extracted from the file.
+    
+    Raises:
+    Exception: If the file extension is not .csv or .parquet.
+    TypeError: If file_path is not a string.
+    FileNotFoundError: If the file is not found in the working directory.
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+    
+    if __debug__:
+        if not isinstance(file_path, str):
+            raise TypeError("file_path must be a string")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}. Ensure it is in the working directory (e.g., 'C:\\Users\\ayomi\\Documents\\Powering Data for the Department of Energy - Building an ETL Pipeline\\').")
+    if file_path.endswith('.csv'):
+        # The pyarrow engine cannot read in chunks, so stream with the C engine
+        return pd.read_csv(file_path, chunksize=chunksize, engine="c", dtype_backend="pyarrow", dtype=dtype)
+    elif file_path.endswith('.parquet'):
+        real_path = os.path.realpath(file_path)
+        stat = os.stat(real_path)
+        metadata = _read_parquet_metadata(real_path, stat.st_mtime_ns, stat.st_size)
+        batches = pq.ParquetFile(file_path, metadata=metadata).iter_batches(batch_size=chunksize)
+        frames = (batch.to_pandas(types_mapper=pd.ArrowDtype) for batch in batches)
+        if dtype:
+            return (frame.astype(dtype) for frame in frames)
+        return frames
+    else:
+        raise Exception("Warning: Invalid file extension. Please try with .csv or .parquet!")
+
+def _flatten_record(record: dict, parent_key: str = '') -> dict:
+    """
+    Flatten nested dictionaries into a single level with dot-separated keys,
+    matching the column names produced by json_normalize.
+    
+    Parameters:
+    record (dict): A single JSON record.
+    parent_key (str): Key prefix of the enclosing object.
+    
+    Returns:
+    dict: Flattened record.
+    """
+    flat = {}
+    for key, value in record.items():
+        flat_key = f"{parent_key}.{key}" if parent_key else key
+        if isinstance(value, dict):
+            flat.update(_flatten_record(value, flat_key))
+        else:
+            flat[flat_key] = value
+    return flat
+
 def extract_json_data(file_path: str) -> pd.DataFrame:
     """
     Extract and flatten data from a JSON file.
     
     Parameters:
-    file_path (str): Path to the JSON file.
+    file_path (str): Path to the JSON file (e.g., 'electricity_capability_nested.json').
     
     Returns:
     pandas.DataFrame: Flattened DataFrame from JSON data.
@@ -40,152 +191,196 @@ def extract_json_data(file_path: str) -> pd.DataFrame:
     Raises:
     Exception: If the file cannot be read or is not valid JSON.
     TypeError: If file_path is not a string.
+    FileNotFoundError: If the file is not found in the working directory.
     """
-    if not isinstance(file_path, str):
-        raise TypeError("file_path must be a string")
+    import orjson
+    import pandas as pd
+    
+    if __debug__:
+        if not isinstance(file_path, str):
+            raise TypeError("file_path must be a string")
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}. Ensure it is in the working directory (e.g., 'C:\\Users\\ayomi\\Documents\\Powering Data for the Department of Energy - Building an ETL Pipeline\\').")
     try:
-        with open(file_path, 'r') as file:
-            data = pd.read_json(file)
-        return json_normalize(data.to_dict(orient='records'))
+        with open(file_path, 'rb') as file:
+            data = orjson.loads(file.read())
+        if isinstance(data, dict):
+            data = [data]
+        # Only objects have fields to flatten; records that are arrays or scalars are loaded as-is
+        if not all(isinstance(record, dict) for record in data):
+            return pd.DataFrame(data)
+        # Flat records can be loaded as-is; only walk them when something is nested
+        if not any(isinstance(value, dict) for record in data for value in record.values()):
+            return pd.DataFrame(data)
+        # Flatten each record in a single recursive walk instead of json_normalize
+        return pd.DataFrame([_flatten_record(record) for record in data])
     except Exception as e:
         raise Exception(f"Error reading JSON file: {str(e)}")
 
-def transform_electricity_sales_data(raw_data: pd.DataFrame) -> pd.DataFrame:
+def _is_fixed_width_period(period: pa.StringArray) -> bool:
     """
-    Transform electricity sales to find the total amount of electricity sold
-    in the residential and transportation sectors.
-    
-    Requirements:
-    - Drop any records with NA values in the `price` column. Do this inplace.
-    - Only keep records with a `sectorName` of "residential" or "transportation".
-    - Create a `month` column using the first 4 characters of the values in `period`.
-    - Create a `year` column using the last 2 characters of the values in `period`.
-    - Return the transformed DataFrame, keeping only the columns `year`, `month`, `stateid`, `price`, and `price-units`.
+    Check whether every period is a non-null 6-character ASCII string (e.g. '202301').
     
     Parameters:
-    raw_data (pandas.DataFrame): Input DataFrame with electricity sales data.
+    period (pyarrow.StringArray): Period values.
     
     Returns:
-    pandas.DataFrame: Transformed DataFrame with specified columns.
-    
-    Raises:
-    KeyError: If required columns are missing.
-    TypeError: If input is not a pandas DataFrame.
+    bool: True if the periods can be split with _split_fixed_width_period.
     """
-    if not isinstance(raw_data, pd.DataFrame):
-        raise TypeError("raw_data must be a pandas DataFrame")
-    
-    required_columns = ['period', 'stateid', 'sectorName', 'price', 'price-units']
-    if not all(col in raw_data.columns for col in required_columns):
-        raise KeyError(f"Missing required columns: {', '.join(set(required_columns) - set(raw_data.columns))}")
+    import pyarrow.compute as pc
     
-    # Create a copy to avoid modifying the input DataFrame
-    transformed_data = raw_data.copy()
-    
-    # Drop rows with NA values in the 'price' column inplace
-    transformed_data.dropna(subset=['price'], inplace=True)
+    if len(period) == 0 or period.null_count:
+        return False
+    lengths = pc.min_max(pc.binary_length(period)).as_py()
+    return lengths['min'] == lengths['max'] == 6 and pc.all(pc.string_is_ascii(period)).as_py()
+
+def _split_fixed_width_period(period: pa.StringArray) -> tuple:
+    """
+    Split 6-character ASCII periods into their first 4 and last 2 characters.
     
-    # Filter for 'residential' or 'transportation' in sectorName
-    transformed_data = transformed_data[transformed_data['sectorName'].isin(['residential', 'transportation'])]
+    The Arrow data buffer is viewed as an (n, 6) byte matrix and sliced column-wise,
+    so no per-row string objects or offset lookups are needed.
     
-    # Create 'month' column (first 4 characters of 'period')
-    transformed_data['month'] = transformed_data['period'].str[:4]
+    Parameters:
+    period (pyarrow.StringArray): Period values accepted by _is_fixed_width_period.
     
-    # Create 'year' column (last 2 characters of 'period')
-    transformed_data['year'] = transformed_data['period'].str[-2:]
+    Returns:
+    tuple: (first 4 characters, last 2 characters) as pyarrow.StringArray.
+    """
+    import numpy as np
+    import pyarrow as pa
+    
+    n = len(period)
+    start = np.frombuffer(period.buffers()[1], dtype=np.int32)[period.offset]
+    data = np.frombuffer(period.buffers()[2], dtype=np.uint8)[start:start + 6 * n].reshape(n, 6)
+    head = np.ascontiguousarray(data[:, :4])
+    tail = np.ascontiguousarray(data[:, 4:])
+    return (
+        pa.StringArray.from_buffers(n, pa.py_buffer(np.arange(0, 4 * n + 1, 4, dtype=np.int32)), pa.py_buffer(head)),
+        pa.StringArray.from_buffers(n, pa.py_buffer(np.arange(0, 2 * n + 1, 2, dtype=np.int32)), pa.py_buffer(tail)),
+    )
+
+def _split_period(period: pa.Array) -> tuple:
+    """
+    Split periods into their first 4 and last 2 characters with Arrow kernels.
     
-    # Select only the required columns
-    transformed_data = transformed_data[['year', 'month', 'stateid', 'price', 'price-units']]
+    Parameters:
+    period (pyarrow.Array or pyarrow.ChunkedArray): Period values; non-string values are cast to strings first.
     
-    return transformed_data
+    Returns:
+    tuple: (first 4 characters, last 2 characters) as pyarrow.StringArray.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    period = pc.cast(period, pa.string())
+    if isinstance(period, pa.ChunkedArray):
+        # Table columns and multi-chunk ArrowDtype columns are chunked; the buffer split needs one contiguous array
+        period = period.combine_chunks()
+    if _is_fixed_width_period(period):
+        return _split_fixed_width_period(period)
+    return pc.utf8_slice_codeunits(period, 0, 4), pc.utf8_slice_codeunits(period, -2)
 
-def load(dataframe: pd.DataFrame, file_path: str) -> None:
+def _transform_arrow_columns(data: pd.DataFrame) -> pd.DataFrame:
     """
-    Load a DataFrame to a file in either CSV or Parquet format.
+    Filter, slice and project Arrow-backed sales data entirely on an Arrow table,
+    converting back to pandas once at the end.
     
     Parameters:
-    dataframe (pandas.DataFrame): DataFrame to be saved.
-    file_path (str): Path to the output file.
+    data (pandas.DataFrame): Sales data whose required columns all use pd.ArrowDtype.
     
-    Raises:
-    Exception: If the file extension is not .csv or .parquet.
-    TypeError: If dataframe is not a pandas DataFrame or file_path is not a string.
+    Returns:
+    pandas.DataFrame: Transformed DataFrame with Arrow-backed columns.
     """
-    if not isinstance(dataframe, pd.DataFrame):
-        raise TypeError("dataframe must be a pandas DataFrame")
-    if not isinstance(file_path, str):
-        raise TypeError("file_path must be a string")
-    if file_path.endswith('.csv'):
-        dataframe.to_csv(file_path, index=False)
-    elif file_path.endswith('.parquet'):
-        dataframe.to_parquet(file_path, index=False)
-    else:
-        raise Exception(f"Warning: {file_path} is not a valid file type. Please try again!")
-    
-
-# Test scripts of the ETL pipeline functions
-raw_electricity_capability_df = extract_json_data("electricity_capability_nested.json")
-raw_electricity_sales_df = extract_tabular_data("electricity_sales.csv")
-cleaned_electricity_sales_df = transform_electricity_sales_data(raw_electricity_sales_df)
-load(raw_electricity_capability_df, "loaded__electricity_capability.parquet")
-load(cleaned_electricity_sales_df, "loaded__electricity_sales.csv")
-
-import pandas as pd
-import json
-from pandas import json_normalize
-import os
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    table = pa.Table.from_pandas(data[list(_SALES_REQUIRED_COLUMNS)], preserve_index=False)
+    
+    # Keep non-null prices in the 'residential' or 'transportation' sectors
+    sector = table['sectorName']
+    in_sectors = pc.fill_null(pc.or_(pc.equal(sector, 'residential'), pc.equal(sector, 'transportation')), False)
+    keep = pc.and_(pc.is_valid(table['price']), in_sectors)
+    table = table.filter(keep)
+    
+    month, year = _split_period(table['period'].combine_chunks())
+    transformed_data = pa.table({
+        'year': year,
+        'month': month,
+        'stateid': table['stateid'],
+        'price': table['price'],
+        'price-units': table['price-units'],
+    }).to_pandas(types_mapper=pd.ArrowDtype)
+    transformed_data.index = data.index[keep.to_numpy(zero_copy_only=False)]
+    return transformed_data
 
-def extract_tabular_data(file_path: str) -> pd.DataFrame:
+def _transform_pandas_columns(data: pd.DataFrame) -> pd.DataFrame:
     """
-    Extract data from a tabular file format, with pandas.
+    Filter, slice and project sales data that is not fully Arrow-backed
+    (e.g. object-dtype or categorical columns), keeping the input column dtypes.
     
     Parameters:
-    file_path (str): Path to the input file (e.g., 'electricity_sales.csv').
+    data (pandas.DataFrame): Sales data with the required columns.
     
     Returns:
-    pandas.DataFrame: Data extracted from the file.
-    
-    Raises:
-    Exception: If the file extension is not .csv or .parquet.
-    TypeError: If file_path is not a string.
-    FileNotFoundError: If the file is not found in the working directory.
+    pandas.DataFrame: Transformed DataFrame.
     """
-    if not isinstance(file_path, str):
-        raise TypeError("file_path must be a string")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}. Ensure it is in the working directory (e.g., 'C:\\Users\\ayomi\\Documents\\Powering Data for the Department of Energy - Building an ETL Pipeline\\').")
-    if file_path.endswith('.csv'):
-        return pd.read_csv(file_path)
-    elif file_path.endswith('.parquet'):
-        return pd.read_parquet(file_path)
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    # Build a single mask: non-null price and a sectorName of 'residential' or 'transportation'
+    sector = data['sectorName']
+    if sector.dtype == object:
+        sector = sector.to_numpy(dtype=object, na_value=None)
+        in_sectors = (sector == 'residential') | (sector == 'transportation')
+    elif isinstance(sector.dtype, pd.CategoricalDtype):
+        # Categorical: compare the integer codes against the codes of the two sectors
+        sector_codes = sector.cat.categories.get_indexer(['residential', 'transportation'])
+        in_sectors = np.isin(sector.cat.codes.to_numpy(), sector_codes[sector_codes >= 0])
     else:
-        raise Exception("Warning: Invalid file extension. Please try with .csv or .parquet!")
+        # Arrow-backed strings: compare with Arrow kernels rather than materialising Python strings
+        sector = pa.array(sector, from_pandas=True)
+        in_sectors = pc.fill_null(pc.or_(pc.equal(sector, 'residential'), pc.equal(sector, 'transportation')), False).to_numpy(zero_copy_only=False)
+    keep = data['price'].notna().to_numpy() & in_sectors
+    period = data['period'][keep]
+    
+    if period.dtype == object:
+        # Object-dtype input: slice the underlying ndarray directly instead of going through the .str accessor.
+        # Like .str, missing and non-string values (e.g. an int period in a mixed column) give a missing result.
+        period_vals = period.to_numpy()
+        month = [p[:4] if isinstance(p, str) else None for p in period_vals]
+        year = [p[-2:] if isinstance(p, str) else None for p in period_vals]
+    else:
+        month, year = _split_period(pa.array(period, from_pandas=True))
+        month = pd.array(month, dtype=pd.ArrowDtype(pa.string()))
+        year = pd.array(year, dtype=pd.ArrowDtype(pa.string()))
+    
+    # Select the kept rows with one .loc call and add the derived columns in a single assign
+    return (
+        data.loc[keep, ['stateid', 'price', 'price-units']]
+        .assign(year=year, month=month)
+        [['year', 'month', 'stateid', 'price', 'price-units']]
+    )
 
-def extract_json_data(file_path: str) -> pd.DataFrame:
+def _transform(data: pd.DataFrame) -> pd.DataFrame:
     """
-    Extract and flatten data from a JSON file.
+    Transform validated sales data with the fixed schema, choosing the Arrow
+    path when every required column is Arrow-backed.
     
     Parameters:
-    file_path (str): Path to the JSON file (e.g., 'electricity_capability_nested.json').
+    data (pandas.DataFrame): Sales data with the required columns already named.
     
     Returns:
-    pandas.DataFrame: Flattened DataFrame from JSON data.
-    
-    Raises:
-    Exception: If the file cannot be read or is not valid JSON.
-    TypeError: If file_path is not a string.
-    FileNotFoundError: If the file is not found in the working directory.
+    pandas.DataFrame: Transformed DataFrame.
     """
-    if not isinstance(file_path, str):
-        raise TypeError("file_path must be a string")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}. Ensure it is in the working directory (e.g., 'C:\\Users\\ayomi\\Documents\\Powering Data for the Department of Energy - Building an ETL Pipeline\\').")
-    try:
-        with open(file_path, 'r') as file:
-            data = pd.read_json(file)
-        return json_normalize(data.to_dict(orient='records'))
-    except Exception as e:
-        raise Exception(f"Error reading JSON file: {str(e)}")
+    import pandas as pd
+    
+    if all(isinstance(data[col].dtype, pd.ArrowDtype) for col in _SALES_REQUIRED_COLUMNS):
+        return _transform_arrow_columns(data)
+    return _transform_pandas_columns(data)
 
 def transform_electricity_sales_data(raw_data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -193,7 +388,7 @@ def transform_electricity_sales_data(raw_data: pd.DataFrame) -> pd.DataFrame:
     in the residential and transportation sectors.
     
     Requirements:
-    - Drop any records with NA values in the `price` column. Do this inplace.
+    - Drop any records with NA values in the `price` column.
     - Only keep records with a `sectorName` of "residential" or "transportation".
     - Create a `month` column using the first 4 characters of the values in `period`.
     - Create a `year` column using the last 2 characters of the values in `period`.
@@ -206,59 +401,59 @@ def transform_electricity_sales_data(raw_data: pd.DataFrame) -> pd.DataFrame:
     pandas.DataFrame: Transformed DataFrame with specified columns.
     
     Raises:
-    KeyError: If required columns are missing.
+    KeyError: If required columns are missing, or several columns map to the same required column.
     TypeError: If input is not a pandas DataFrame.
     """
-    if not isinstance(raw_data, pd.DataFrame):
-        raise TypeError("raw_data must be a pandas DataFrame")
-    
-    # Define expected columns and possible variations
-    required_columns = ['period', 'stateid', 'sectorName', 'price', 'price-units']
-    column_mapping = {
-        'Period': 'period',
-        'Date': 'period',  # Possible variation from incorrect CSV
-        'StateID': 'stateid',
-        'StateId': 'stateid',
-        'SectorName': 'sectorName',
-        'sectorname': 'sectorName',
-        'Price': 'price',
-        'UnitPrice': 'price',  # Possible variation
-        'Price-Units': 'price-units',
-        'price_units': 'price-units',
-        'unit_price': 'price-units'  # Possible variation
-    }
+    import pandas as pd
     
-    # Rename columns to match expected names
-    transformed_data = raw_data.copy()
-    for actual_col, expected_col in column_mapping.items():
-        if actual_col in transformed_data.columns:
-            transformed_data.rename(columns={actual_col: expected_col}, inplace=True)
+    if __debug__:
+        if not isinstance(raw_data, pd.DataFrame):
+            raise TypeError("raw_data must be a pandas DataFrame")
+    
+    # Rename columns to match expected names, on a projection of only the columns that can map
+    # to a required column rather than a copy of the whole frame
+    source_cols = [col for col in raw_data.columns if col in _SALES_INPUT_COLUMNS]
+    transformed_data = raw_data[source_cols].rename(columns=_SALES_COLUMN_MAPPING)
     
     # Early validation: check if any required columns are present
-    if not any(col in transformed_data.columns for col in required_columns):
-        raise KeyError(f"No required columns found. Expected: {', '.join(required_columns)}. Actual: {', '.join(raw_data.columns)}. Ensure 'electricity_sales.csv' contains electricity sales data.")
+    missing_cols = _SALES_REQUIRED_COLUMN_SET.difference(transformed_data.columns)
+    if len(missing_cols) == len(_SALES_REQUIRED_COLUMNS):
+        raise KeyError(f"No required columns found. Expected: {', '.join(_SALES_REQUIRED_COLUMNS)}. Actual: {', '.join(raw_data.columns)}. Ensure 'electricity_sales.csv' contains electricity sales data.")
     
     # Check for missing required columns
-    if not all(col in transformed_data.columns for col in required_columns):
-        missing_cols = [col for col in required_columns if col not in transformed_data.columns]
-        raise KeyError(f"Missing required columns: {', '.join(missing_cols)}. Actual columns in CSV: {', '.join(raw_data.columns)}. Ensure 'electricity_sales.csv' matches the expected data dictionary.")
+    if missing_cols:
+        raise KeyError(f"Missing required columns: {', '.join(sorted(missing_cols))}. Actual columns in CSV: {', '.join(raw_data.columns)}. Ensure 'electricity_sales.csv' matches the expected data dictionary.")
     
-    # Drop rows with NA values in the 'price' column inplace
-    transformed_data.dropna(subset=['price'], inplace=True)
+    # Check for source columns that map to the same required column (e.g. both 'price' and 'Price')
+    duplicated = transformed_data.columns.duplicated(keep=False)
+    if duplicated.any():
+        conflicting_cols = [col for col, is_duplicate in zip(source_cols, duplicated) if is_duplicate]
+        raise KeyError(f"Conflicting columns: {', '.join(conflicting_cols)} map to the same required column. Actual columns in CSV: {', '.join(raw_data.columns)}. Ensure 'electricity_sales.csv' has one column per field in the data dictionary.")
     
-    # Filter for 'residential' or 'transportation' in sectorName
-    transformed_data = transformed_data[transformed_data['sectorName'].isin(['residential', 'transportation'])]
+    return _transform(transformed_data)
+
+def _parquet_write_options(dataframe: pd.DataFrame) -> dict:
+    """
+    PyArrow Parquet writer options shared by load and load_chunked.
     
-    # Create 'month' column (first 4 characters of 'period')
-    transformed_data['month'] = transformed_data['period'].str[:4]
+    Non-float columns (IDs, sector names, units, periods) are dictionary encoded;
+    float measurements rarely repeat, so they are written without a dictionary.
+    Column statistics are written so readers can skip row groups.
     
-    # Create 'year' column (last 2 characters of 'period')
-    transformed_data['year'] = transformed_data['period'].str[-2:]
+    Parameters:
+    dataframe (pandas.DataFrame): DataFrame that will be written.
     
-    # Select only the required columns
-    transformed_data = transformed_data[['year', 'month', 'stateid', 'price', 'price-units']]
+    Returns:
+    dict: Keyword arguments for pyarrow.parquet.write_table / ParquetWriter.
+    """
+    import pandas as pd
     
-    return transformed_data
+    return {
+        'compression': 'snappy',
+        'use_dictionary': [col for col in dataframe.columns if not pd.api.types.is_float_dtype(dataframe[col].dtype)],
+        'data_page_size': 1 << 20,
+        'write_statistics': True,
+    }
 
 def load(dataframe: pd.DataFrame, file_path: str) -> None:
     """
@@ -272,30 +467,147 @@ def load(dataframe: pd.DataFrame, file_path: str) -> None:
     Exception: If the file extension is not .csv or .parquet.
     TypeError: If dataframe is not a pandas DataFrame or file_path is not a string.
     """
-    if not isinstance(dataframe, pd.DataFrame):
-        raise TypeError("dataframe must be a pandas DataFrame")
-    if not isinstance(file_path, str):
-        raise TypeError("file_path must be a string")
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if __debug__:
+        if not isinstance(dataframe, pd.DataFrame):
+            raise TypeError("dataframe must be a pandas DataFrame")
+        if not isinstance(file_path, str):
+            raise TypeError("file_path must be a string")
     if file_path.endswith('.csv'):
         dataframe.to_csv(file_path, index=False)
     elif file_path.endswith('.parquet'):
-        dataframe.to_parquet(file_path, index=False)
+        # Write a single large row group so the footer stays small for later chunked reads
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        pq.write_table(table, file_path, row_group_size=max(len(dataframe), 64_000), **_parquet_write_options(dataframe))
+    else:
+        raise Exception(f"Warning: {file_path} is not a valid file type. Please try again!")
+
+def _is_null_type(data_type: pa.DataType) -> bool:
+    """
+    Check whether an inferred Arrow type carries no value type, i.e. null or a dictionary
+    of nulls (a categorical column with no categories).
+    
+    Parameters:
+    data_type (pyarrow.DataType): Type to check.
+    
+    Returns:
+    bool: True if the type cannot hold non-null values.
+    """
+    import pyarrow as pa
+    
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    return pa.types.is_null(data_type)
+
+def _fill_null_fields(schema: Optional[pa.Schema], chunk_schema: pa.Schema) -> pa.Schema:
+    """
+    Replace the null-typed fields of an inferred schema with their types in a later chunk.
+    
+    Parameters:
+    schema (pyarrow.Schema or None): Schema inferred so far, or None for the first chunk.
+    chunk_schema (pyarrow.Schema): Schema inferred from the next chunk.
+    
+    Returns:
+    pyarrow.Schema: Schema with the null fields that have values in the chunk filled in.
+    """
+    if schema is None:
+        return chunk_schema
+    for i, field in enumerate(schema):
+        if _is_null_type(field.type):
+            schema = schema.set(i, field.with_type(chunk_schema.field(field.name).type))
+    return schema
+
+def load_chunked(dataframes: Iterable[pd.DataFrame], file_path: str, schema: Optional[pa.Schema] = None) -> None:
+    """
+    Load a stream of DataFrames into a single CSV or Parquet file, writing each
+    chunk as it arrives instead of collecting them first.
+    
+    Parameters:
+    dataframes (Iterable[pandas.DataFrame]): Chunks to be saved, all with the same columns.
+    file_path (str): Path to the output file.
+    schema (pyarrow.Schema, optional): Parquet schema every chunk is cast to (e.g., sales_output_schema()).
+        If omitted, it is inferred from the chunks; a column that is entirely null in the first chunk
+        takes the type of the first chunk where it has values, and chunks are held in memory until then.
+    
+    Raises:
+    Exception: If the file extension is not .csv or .parquet.
+    TypeError: If file_path is not a string.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if __debug__:
+        if not isinstance(file_path, str):
+            raise TypeError("file_path must be a string")
+    if file_path.endswith('.csv'):
+        with open(file_path, 'w', newline='') as file:
+            header = True
+            for dataframe in dataframes:
+                dataframe.to_csv(file, header=header, index=False)
+                header = False
+    elif file_path.endswith('.parquet'):
+        writer = None
+        writer_schema = schema
+        pending = []
+        try:
+            for dataframe in dataframes:
+                table = pa.Table.from_pandas(dataframe, preserve_index=False)
+                if writer is None:
+                    if schema is None:
+                        # All-blank columns are inferred as null, which cannot hold later values, so
+                        # hold chunks back until each column's type is known from a chunk that has values
+                        writer_schema = _fill_null_fields(writer_schema, table.schema)
+                        pending.append(table)
+                        if any(_is_null_type(field.type) for field in writer_schema):
+                            continue
+                    writer = pq.ParquetWriter(file_path, writer_schema, **_parquet_write_options(dataframe))
+                    tables, pending = pending or [table], []
+                else:
+                    tables = [table]
+                for table in tables:
+                    if not table.schema.equals(writer.schema):
+                        # Chunks infer their own types (e.g. null for an all-blank column, dictionaries for categoricals)
+                        table = table.cast(writer.schema)
+                    writer.write_table(table)
+            if pending:
+                # Some column was null in every chunk; write it as null
+                writer = pq.ParquetWriter(file_path, writer_schema, **_parquet_write_options(dataframe))
+                for table in pending:
+                    writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
     else:
         raise Exception(f"Warning: {file_path} is not a valid file type. Please try again!")
 
 # Test script for the ETL pipeline
 if __name__ == "__main__":
+    # Sales output is Parquet by default; pass --legacy-csv to keep writing CSV
+    if "--legacy-csv" in sys.argv[1:]:
+        sales_output_path = "loaded__electricity_sales.csv"
+    else:
+        sales_output_path = "loaded__electricity_sales.parquet"
+
     try:
-        # Extract
-        raw_electricity_capability_df = extract_json_data("electricity_capability_nested.json")
-        raw_electricity_sales_df = extract_tabular_data("electricity_sales.csv")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Extract (the JSON file is read on a worker thread while the sales data streams)
+            raw_electricity_capability_future = executor.submit(extract_json_data, "electricity_capability_nested.json")
+            # Low-cardinality sales columns are parsed straight into categoricals
+            raw_electricity_sales_chunks = extract_tabular_data_chunked(
+                "electricity_sales.csv",
+                dtype={'stateid': 'category', 'sectorName': 'category', 'price-units': 'category'},
+            )
 
-        # Transform
-        cleaned_electricity_sales_df = transform_electricity_sales_data(raw_electricity_sales_df)
+            # Transform (lazily, one chunk at a time as the sales data is loaded)
+            cleaned_electricity_sales_chunks = (transform_electricity_sales_data(chunk) for chunk in raw_electricity_sales_chunks)
 
-        # Load
-        load(raw_electricity_capability_df, "loaded__electricity_capability.parquet")
-        load(cleaned_electricity_sales_df, "loaded__electricity_sales.csv")
+            # Load (both outputs are written concurrently)
+            sales_load_future = executor.submit(load_chunked, cleaned_electricity_sales_chunks, sales_output_path, sales_output_schema())
+            load(raw_electricity_capability_future.result(), "loaded__electricity_capability.parquet")
+            sales_load_future.result()
         print("ETL pipeline completed successfully!")
     except FileNotFoundError as e:
         print(f"Pipeline failed: {e}")